@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Git 信息读取基准
+在临时目录中创建各种形态的仓库（普通仓库、worktree、分离 HEAD、无远程、子目录、非仓库），
+比较 get_git_info（直接解析 .git）与 git 命令实现的结果和耗时
+"""
+
+import sys
+import time
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from project_config import ProjectConfigManager
+
+
+def git(*args, cwd):
+    subprocess.run(["git", *args], cwd=str(cwd), check=True, capture_output=True)
+
+
+def make_repos(root: Path, count: int) -> list:
+    """创建 count 个普通仓库以及若干特殊形态的目录，返回要读取的路径列表"""
+    paths = []
+    for i in range(count):
+        repo = root / f"repo{i}"
+        repo.mkdir()
+        git("init", "-q", "-b", f"branch-{i}", cwd=repo)
+        git("remote", "add", "origin", f"https://example.com/org/repo{i}.git", cwd=repo)
+        paths.append(repo)
+
+    # worktree（.git 是 gitdir 文件，配置在 commondir 中）
+    main = root / "main"
+    main.mkdir()
+    git("init", "-q", "-b", "main", cwd=main)
+    git("remote", "add", "origin", "git@example.com:org/main.git", cwd=main)
+    git("-c", "user.name=bench", "-c", "user.email=bench@example.com",
+        "commit", "-q", "--allow-empty", "-m", "init", cwd=main)
+    git("worktree", "add", "-q", "-b", "feature", str(root / "wt"), cwd=main)
+    paths += [main, root / "wt"]
+
+    # 分离 HEAD
+    detached = root / "detached"
+    git("clone", "-q", str(main), str(detached), cwd=root)
+    git("checkout", "-q", "--detach", cwd=detached)
+    paths.append(detached)
+
+    # 无远程、仓库子目录、非仓库目录
+    bare_local = root / "local-only"
+    bare_local.mkdir()
+    git("init", "-q", cwd=bare_local)
+    (main / "src" / "pkg").mkdir(parents=True)
+    plain = root / "plain"
+    plain.mkdir()
+    paths += [bare_local, main / "src" / "pkg", plain]
+    return paths
+
+
+def time_all(func, paths, runs: int) -> float:
+    """返回每次读取的平均耗时（毫秒）"""
+    start = time.perf_counter()
+    for _ in range(runs):
+        for path in paths:
+            func(path)
+    return (time.perf_counter() - start) * 1000 / (runs * len(paths))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="get_git_info 基准：直接解析 .git 与 git 命令对比")
+    parser.add_argument("--repos", "-n", type=int, default=50, help="普通仓库数量（默认：50）")
+    parser.add_argument("--runs", type=int, default=3, help="重复次数（默认：3）")
+    args = parser.parse_args()
+
+    manager = ProjectConfigManager()
+    with tempfile.TemporaryDirectory() as tmp:
+        # 临时目录可能位于其他仓库中，使用 resolve 后的路径
+        root = Path(tmp).resolve()
+        paths = make_repos(root, args.repos)
+
+        mismatches = 0
+        for path in paths:
+            fast = manager.get_git_info(path)
+            slow = manager._get_git_info_subprocess(path)
+            if fast != slow:
+                mismatches += 1
+                print(f"❌ {path.relative_to(root)}: {fast} != {slow}")
+        print(f"✅ {len(paths) - mismatches}/{len(paths)} 个目录结果一致")
+
+        fast_ms = time_all(manager.get_git_info, paths, args.runs)
+        slow_ms = time_all(manager._get_git_info_subprocess, paths, args.runs)
+        print(f"直接解析: {fast_ms:8.3f} ms/目录")
+        print(f"git 命令: {slow_ms:8.3f} ms/目录")
+        print(f"加速: {slow_ms / fast_ms:.0f}x")
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
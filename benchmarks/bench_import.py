@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+启动耗时基准
+在独立子进程中反复导入 cloud_config_reader / project_config 并执行 --help，
+统计冷启动耗时，并列出 python -X importtime 中累计耗时最高的模块
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CASES = [
+    ("import cloud_config_reader", ["-c", "import cloud_config_reader"]),
+    ("import project_config", ["-c", "import project_config"]),
+    ("cloud-config --help", [str(ROOT / "cloud_config_reader.py"), "--help"]),
+    ("project-config --help", [str(ROOT / "project_config.py"), "--help"]),
+]
+
+
+def run_case(args, runs: int) -> list:
+    """执行 runs 次，返回每次的耗时（毫秒）"""
+    env = dict(os.environ, PYTHONPATH=str(ROOT), PYTHONDONTWRITEBYTECODE="1")
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, cwd=str(ROOT), env=env,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def top_imports(module: str, limit: int) -> list:
+    """解析 -X importtime 输出，返回累计耗时最高的 (微秒, 模块名) 列表"""
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=str(ROOT), env=env, capture_output=True, text=True, check=True)
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        entries.append((int(cumulative), name.strip()))
+    return sorted(entries, reverse=True)[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="cloud-config / project-config 启动耗时基准")
+    parser.add_argument("--runs", "-n", type=int, default=10, help="每项重复次数（默认：10）")
+    parser.add_argument("--top", type=int, default=10, help="列出的最慢导入数量（默认：10）")
+    args = parser.parse_args()
+
+    print(f"🐍 {sys.version.split()[0]}，每项 {args.runs} 次")
+    print(f"{'场景':<28}{'最小':>10}{'中位数':>10}{'最大':>10}")
+    for label, case_args in CASES:
+        timings = run_case(case_args, args.runs)
+        print(f"{label:<28}{min(timings):>8.1f}ms{statistics.median(timings):>8.1f}ms{max(timings):>8.1f}ms")
+
+    for module in ("cloud_config_reader", "project_config"):
+        print(f"\n📦 {module} 导入耗时 Top {args.top}（累计，毫秒）:")
+        for cumulative, name in top_imports(module, args.top):
+            print(f"  {cumulative / 1000:>8.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
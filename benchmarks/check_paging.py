@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+分页检查
+在服务端最大行数（--max-rows）远小于各入口 page_size 的 PostgREST 桩服务上运行分页读取的入口，
+检查读取结果没有被截断：每页都不满时仍要读到空页为止。全程离线运行，有不一致时退出码为 1。
+
+    python benchmarks/check_paging.py
+    python benchmarks/check_paging.py --max-rows 7 --groups 50
+"""
+
+import io
+import sys
+import asyncio
+import argparse
+import tempfile
+from pathlib import Path
+from contextlib import redirect_stdout
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+sys.path.insert(0, str(BENCH_DIR))
+
+from postgrest_stub import PostgRESTStub
+from cloud_config_reader import CloudConfigReader, AsyncCloudConfigReader, SQLiteBackend
+from project_config import ProjectConfigManager
+
+
+def _run_async(stub: PostgRESTStub, method: str, **kwargs) -> int:
+    async def run():
+        async with AsyncCloudConfigReader(stub.url, "check-key") as reader:
+            return len(await getattr(reader, method)(**kwargs))
+    return asyncio.run(run())
+
+
+def _replicate(context) -> int:
+    local = SQLiteBackend(str(context["tmp"] / "replica.db"))
+    return local.replicate(context["reader"].backend)["config_groups"]
+
+
+# 检查项名称 -> (函数(context) -> 实际值, 期望值的来源表)
+CHECKS = {
+    "list_groups": (lambda context: len(context["reader"].list_groups()), "config_groups"),
+    "get_all_configs": (lambda context: len(context["reader"].get_all_configs()), "config_groups"),
+    "get_all_configs(per-group)": (lambda context: len(context["reader"].get_all_configs(bulk=False)), "config_groups"),
+    "iter_export": (lambda context: sum(1 for _ in context["reader"].iter_export()), "config_groups"),
+    "sync": (lambda context: len(context["reader"].sync()["items"]), "config_items"),
+    "apply_configs(无变化)": (
+        lambda context: len(context["reader"].apply_configs(context["reader"].export_configs())), None),
+    "replicate": (_replicate, "config_groups"),
+    "list_projects": (lambda context: len(context["manager"].list_projects()), "project_info"),
+    "AsyncCloudConfigReader.list_groups": (lambda context: _run_async(context["stub"], "list_groups"), "config_groups"),
+    "AsyncCloudConfigReader.get_all_configs": (
+        lambda context: _run_async(context["stub"], "get_all_configs"), "config_groups"),
+    "AsyncCloudConfigReader.get_all_configs(per-group)": (
+        lambda context: _run_async(context["stub"], "get_all_configs", bulk=False), "config_groups"),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="检查服务端最大行数小于 page_size 时分页读取不被截断")
+    parser.add_argument("--max-rows", type=int, default=3, help="桩服务每个响应的最大行数（默认：3）")
+    parser.add_argument("--groups", type=int, default=20, help="配置组数量（默认：20）")
+    parser.add_argument("--items", type=int, default=4, help="每组配置项数量（默认：4）")
+    parser.add_argument("--projects", type=int, default=20, help="project_info 行数（默认：20）")
+    args = parser.parse_args()
+
+    failures = 0
+    with PostgRESTStub(max_rows=args.max_rows) as stub, tempfile.TemporaryDirectory() as tmp:
+        stub.database.seed(groups=args.groups, items=args.items, projects=args.projects)
+        reader = CloudConfigReader(stub.url, "check-key", use_daemon=False, use_cache=False)
+        manager = ProjectConfigManager(stub.url, "check-key")
+        # 固定使用 REST API，结果不受是否安装 supabase 影响
+        reader.backend.use_rest_api = True
+        manager.backend.use_rest_api = True
+        context = {"stub": stub, "reader": reader, "manager": manager, "tmp": Path(tmp)}
+
+        print(f"🔎 服务端最大行数 {args.max_rows}，{args.groups} 组 × {args.items} 项，{args.projects} 个项目")
+        for name, (func, table) in CHECKS.items():
+            expected = len(stub.database.tables[table]) if table else 0
+            try:
+                with redirect_stdout(io.StringIO()):
+                    actual = func(context)
+            except ImportError as e:
+                print(f"{name:<50}⏭️ 跳过（{e}）")
+                continue
+            ok = actual == expected
+            failures += not ok
+            print(f"{name:<50}{actual:>6} / {expected:<6}{'✅' if ok else '❌'}")
+
+    if failures:
+        print(f"\n❌ {failures} 项检查的结果不完整")
+        sys.exit(1)
+    print("\n✅ 分页读取结果完整")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+本地 PostgREST 兼容桩服务（仅用于基准测试，不依赖网络）
+
+支持 cloud-config / project-config 用到的子集:
+- GET: select（含嵌入资源、!inner、嵌入资源上的过滤和排序）、eq/neq/gt/gte/lt/lte/like/ilike/in/is 过滤、
+  order、limit/offset、Range 请求头、Content-Range（Prefer: count=exact）
+- POST: 单行/多行插入，on_conflict + Prefer: resolution=merge-duplicates / ignore-duplicates
+- PATCH / DELETE: 按过滤条件更新或删除
+
+可注入固定延迟（模拟网络往返），并生成 N 个配置组 × M 个配置项的合成数据。
+"""
+
+import re
+import json
+import time
+import uuid
+import itertools
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qsl
+
+# 一对多关系：(父表, 子表) -> (父表列, 子表列)
+RELATIONS = {
+    ("config_groups", "config_items"): ("id", "group_id"),
+    ("config_environments", "environment_configs"): ("id", "environment_id"),
+    ("config_groups", "environment_configs"): ("id", "group_id"),
+}
+
+TABLES = ("config_groups", "config_items", "config_environments", "environment_configs",
+          "config_tombstones", "project_info")
+
+# 这些参数不是列过滤条件
+RESERVED_PARAMS = ("select", "order", "limit", "offset", "on_conflict", "or", "and")
+
+
+def _split_top_level(text: str) -> list:
+    """按顶层逗号拆分 select 表达式（忽略括号内的逗号）"""
+    parts, depth, current = [], 0, ""
+    for ch in text:
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        if ch == "," and depth == 0:
+            parts.append(current)
+            current = ""
+        else:
+            current += ch
+    parts.append(current)
+    return [part.strip() for part in parts if part.strip()]
+
+
+def parse_select(text: str) -> list:
+    """解析 select，返回 ("col", 列名) 或 ("embed", 别名, 表名, 是否 inner, 子字段) 列表"""
+    fields = []
+    for token in _split_top_level(text):
+        match = re.match(r"^(?:(\w+):)?(\w+)(!inner)?\((.*)\)$", token, re.S)
+        if match:
+            fields.append(("embed", match.group(1) or match.group(2), match.group(2),
+                           bool(match.group(3)), parse_select(match.group(4))))
+        else:
+            fields.append(("col", token))
+    return fields
+
+
+def _match(value, operator: str, argument: str) -> bool:
+    if operator == "eq":
+        if isinstance(value, bool):
+            return str(value).lower() == argument
+        return value is not None and str(value) == argument
+    if operator == "neq":
+        return str(value) != argument
+    if operator in ("gt", "gte", "lt", "lte"):
+        if value is None:
+            return False
+        other = type(value)(argument) if isinstance(value, (int, float)) and not isinstance(value, bool) else argument
+        return {"gt": value > other, "gte": value >= other, "lt": value < other, "lte": value <= other}[operator]
+    if operator in ("like", "ilike"):
+        pattern = "^" + re.escape(argument.replace("*", "%")).replace("%", ".*").replace("_", ".") + "$"
+        return value is not None and re.match(pattern, str(value), re.I if operator == "ilike" else 0) is not None
+    if operator == "in":
+        return str(value) in [item.strip().strip('"') for item in argument.strip("()").split(",")]
+    if operator == "is":
+        return value is None if argument == "null" else str(value).lower() == argument
+    raise ValueError(f"不支持的操作符: {operator}")
+
+
+def _filter_rows(rows: list, params: dict, prefix: str) -> list:
+    """按 prefix 下的列过滤条件（如 config_items.key=eq.x）过滤行"""
+    conditions = []
+    for name, expression in params.items():
+        if not name.startswith(prefix):
+            continue
+        column = name[len(prefix):]
+        if "." in column or column in RESERVED_PARAMS:
+            continue
+        operator, _, argument = expression.partition(".")
+        negate = operator == "not"
+        if negate:
+            operator, _, argument = argument.partition(".")
+        conditions.append((column, operator, argument, negate))
+    return [row for row in rows
+            if all(_match(row.get(column), operator, argument) != negate
+                   for column, operator, argument, negate in conditions)]
+
+
+def _order_rows(rows: list, spec: str) -> list:
+    for part in reversed(spec.split(",")):
+        bits = part.strip().split(".")
+        column, desc = bits[0], "desc" in bits[1:]
+        rows.sort(key=lambda row: ((row.get(column) is None) != desc,
+                                   row.get(column) if row.get(column) is not None else ""),
+                  reverse=desc)
+    return rows
+
+
+class StubDatabase:
+    """桩服务的内存数据和请求统计"""
+
+    def __init__(self, latency: float = 0.0, max_rows: int = 1000):
+        self.tables = {table: [] for table in TABLES}
+        self.lock = threading.Lock()
+        self.latency = latency
+        self.max_rows = max_rows
+        self.requests = 0
+        self.bytes_sent = 0
+        self.version = 0
+        self._ids = itertools.count(1)
+        self._clock = itertools.count(1)
+        self._response_cache = {}
+
+    def new_id(self) -> str:
+        """确定性的 UUID，便于多次运行结果可比较"""
+        return str(uuid.UUID(int=next(self._ids)))
+
+    def now(self) -> str:
+        """单调递增的时间戳（同一事务内的行使用同一个值）"""
+        tick = next(self._clock)
+        return "2025-01-01T00:00:%02d.%06d+00:00" % (tick // 1000000 % 60, tick % 1000000)
+
+    def reset_counters(self):
+        with self.lock:
+            self.requests = 0
+            self.bytes_sent = 0
+
+    def _embed(self, table: str, rows: list, fields: list, params: dict, prefix: str) -> list:
+        result = []
+        for row in rows:
+            output, keep = {}, True
+            for field in fields:
+                if field[0] == "col":
+                    if field[1] == "*":
+                        output.update(row)
+                    else:
+                        output[field[1]] = row.get(field[1])
+                    continue
+                _, alias, name, inner, children_fields = field
+                if (table, name) in RELATIONS:
+                    parent_column, child_column = RELATIONS[(table, name)]
+                    children = [child for child in self.tables[name] if child.get(child_column) == row.get(parent_column)]
+                    many = True
+                elif (name, table) in RELATIONS:
+                    parent_column, child_column = RELATIONS[(name, table)]
+                    children = [child for child in self.tables[name] if child.get(parent_column) == row.get(child_column)]
+                    many = False
+                else:
+                    raise ValueError(f"没有 {table} 到 {name} 的关系")
+                child_prefix = prefix + name + "."
+                children = _filter_rows(children, params, child_prefix)
+                if child_prefix + "order" in params:
+                    children = _order_rows(list(children), params[child_prefix + "order"])
+                built = self._embed(name, children, children_fields, params, child_prefix)
+                if inner and not built:
+                    keep = False
+                output[alias] = built if many else (built[0] if built else None)
+            if keep:
+                result.append(output)
+        return result
+
+    def select(self, table: str, params: dict, range_header: str = None):
+        """执行查询，返回 (行, Content-Range)"""
+        rows = _filter_rows(self.tables[table], params, "")
+        if "order" in params:
+            rows = _order_rows(list(rows), params["order"])
+        built = self._embed(table, rows, parse_select(params.get("select", "*")), params, "")
+        offset = int(params.get("offset", 0))
+        limit = int(params.get("limit", self.max_rows))
+        if range_header:
+            start, end = range_header.split("-")
+            offset, limit = int(start), int(end) - int(start) + 1
+        page = built[offset:offset + min(limit, self.max_rows)]
+        content_range = f"{offset}-{offset + len(page) - 1}/{len(built)}" if page else f"*/{len(built)}"
+        return page, content_range
+
+    def cached_select(self, table: str, params: dict, range_header: str = None):
+        """查询结果按数据版本缓存，重复请求不再重新构建响应（基准测试只衡量客户端开销）"""
+        key = (table, tuple(sorted(params.items())), range_header)
+        with self.lock:
+            cached = self._response_cache.get(key)
+            if cached is not None and cached[0] == self.version:
+                return cached[1], cached[2]
+            version = self.version
+        rows, content_range = self.select(table, params, range_header)
+        body = json.dumps(rows).encode("utf-8")
+        with self.lock:
+            self._response_cache[key] = (version, body, content_range)
+        return body, content_range
+
+    def upsert(self, table: str, rows: list, on_conflict: str = None, prefer: str = "") -> list:
+        written = []
+        with self.lock:
+            self.version += 1
+            timestamp = self.now()
+            columns = on_conflict.split(",") if on_conflict else []
+            for row in rows:
+                existing = None
+                if columns:
+                    existing = next((current for current in self.tables[table]
+                                     if all(current.get(column) == row.get(column) for column in columns)), None)
+                if existing is not None:
+                    if "ignore-duplicates" in prefer:
+                        continue
+                    if "merge-duplicates" not in prefer:
+                        raise KeyError("duplicate key value violates unique constraint")
+                    existing.update(row)
+                    existing["updated_at"] = timestamp
+                    written.append(existing)
+                else:
+                    new_row = dict(row)
+                    new_row.setdefault("id", self.new_id())
+                    new_row.setdefault("created_at", timestamp)
+                    new_row.setdefault("updated_at", timestamp)
+                    self.tables[table].append(new_row)
+                    written.append(new_row)
+        return written
+
+    def update(self, table: str, params: dict, values: dict) -> list:
+        with self.lock:
+            self.version += 1
+            timestamp = self.now()
+            rows = _filter_rows(self.tables[table], params, "")
+            for row in rows:
+                row.update(values)
+                row["updated_at"] = timestamp
+        return rows
+
+    def delete(self, table: str, params: dict) -> list:
+        with self.lock:
+            self.version += 1
+            removed = _filter_rows(self.tables[table], params, "")
+            removed_ids = {id(row) for row in removed}
+            self.tables[table] = [row for row in self.tables[table] if id(row) not in removed_ids]
+        return removed
+
+    def seed(self, groups: int = 20, items: int = 10, value_size: int = 0, projects: int = 0,
+             environments: int = 1):
+        """
+        生成合成数据
+
+        Args:
+            groups: 配置组数量
+            items: 每个配置组的配置项数量
+            value_size: 大于 0 时，每组额外生成一个约 value_size 字节的 JSON 配置项
+            projects: project_info 行数
+            environments: 环境数量（第 k 个环境关联编号能被 k+1 整除的配置组）
+        """
+        envs = [{"id": self.new_id(), "name": "default" if k == 0 else f"env{k}", "is_default": k == 0}
+                for k in range(environments)]
+        self.tables["config_environments"] += envs
+        value_types = ["string", "number", "boolean", "json", "array"]
+        for g in range(groups):
+            group_id = self.new_id()
+            timestamp = self.now()
+            self.tables["config_groups"].append({
+                "id": group_id, "name": f"group{g:05d}", "description": f"合成配置组 {g}",
+                "category": f"cat{g % 5}", "is_active": True, "created_at": timestamp, "updated_at": timestamp
+            })
+            for k, env in enumerate(envs):
+                if g % (k + 1) == 0:
+                    self.tables["environment_configs"].append({
+                        "id": self.new_id(), "environment_id": env["id"], "group_id": group_id,
+                        "is_active": True, "updated_at": timestamp
+                    })
+            for i in range(items):
+                value_type = value_types[i % len(value_types)]
+                value = {"string": f"value-{g}-{i}", "number": str(i * 10), "boolean": "true",
+                         "json": json.dumps({"group": g, "item": i}), "array": json.dumps([g, i])}[value_type]
+                self.tables["config_items"].append({
+                    "id": self.new_id(), "group_id": group_id, "key": f"KEY_{i:04d}", "value": value,
+                    "value_type": value_type, "order_index": i, "created_at": timestamp, "updated_at": timestamp
+                })
+            if value_size > 0:
+                blob = {f"field{n}": "x" * 32 for n in range(max(1, value_size // 45))}
+                self.tables["config_items"].append({
+                    "id": self.new_id(), "group_id": group_id, "key": "LARGE_JSON", "value": json.dumps(blob),
+                    "value_type": "json", "order_index": items, "created_at": timestamp, "updated_at": timestamp
+                })
+        for p in range(projects):
+            timestamp = self.now()
+            self.tables["project_info"].append({
+                "id": self.new_id(), "project_name": f"project{p:05d}", "project_path": f"/work/project{p:05d}",
+                "project_type": "python", "git_repo": f"https://example.com/project{p:05d}.git",
+                "last_opened": timestamp, "created_at": timestamp, "updated_at": timestamp
+            })
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # 与真实服务一样关闭 Nagle，避免小响应被延迟 ACK 拖慢约 40ms
+    disable_nagle_algorithm = True
+    database = None  # 由 PostgRESTStub 设置
+
+    def log_message(self, *args):
+        pass
+
+    def _begin(self):
+        url = urlparse(self.path)
+        table = url.path.split("/rest/v1/")[-1]
+        params = dict(parse_qsl(url.query, keep_blank_values=True))
+        with self.database.lock:
+            self.database.requests += 1
+        if self.database.latency:
+            time.sleep(self.database.latency)
+        return table, params
+
+    def _send(self, status: int, body, headers: dict = None):
+        data = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(data)
+        with self.database.lock:
+            self.database.bytes_sent += len(data)
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"null")
+
+    def _unknown_table(self, table: str) -> bool:
+        if table in self.database.tables:
+            return False
+        self._send(404, {"code": "42P01", "message": f'relation "{table}" does not exist'})
+        return True
+
+    def do_GET(self):
+        table, params = self._begin()
+        if self._unknown_table(table):
+            return
+        try:
+            body, content_range = self.database.cached_select(table, params, self.headers.get("Range"))
+        except Exception as e:
+            return self._send(400, {"message": str(e)})
+        self._send(200, body, {"Content-Range": content_range})
+
+    do_HEAD = do_GET
+
+    def do_POST(self):
+        table, params = self._begin()
+        if self._unknown_table(table):
+            return
+        body = self._body()
+        prefer = self.headers.get("Prefer", "")
+        try:
+            rows = self.database.upsert(table, body if isinstance(body, list) else [body],
+                                        params.get("on_conflict"), prefer)
+        except KeyError as e:
+            return self._send(409, {"code": "23505", "message": str(e)})
+        self._send(201, rows if "return=representation" in prefer else [])
+
+    def do_PATCH(self):
+        table, params = self._begin()
+        if self._unknown_table(table):
+            return
+        self._send(200, self.database.update(table, params, self._body()))
+
+    def do_DELETE(self):
+        table, params = self._begin()
+        if self._unknown_table(table):
+            return
+        self._send(200, self.database.delete(table, params))
+
+
+class PostgRESTStub:
+    """
+    在后台线程中运行的桩服务
+
+        with PostgRESTStub(latency=0.005) as stub:
+            stub.database.seed(groups=100, items=20)
+            reader = CloudConfigReader(stub.url, "bench-key")
+    """
+
+    def __init__(self, latency: float = 0.0, max_rows: int = 1000, port: int = 0):
+        self.database = StubDatabase(latency=latency, max_rows=max_rows)
+        handler = type("Handler", (_Handler,), {"database": self.database})
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self) -> "PostgRESTStub":
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="启动本地 PostgREST 桩服务（Ctrl+C 退出）")
+    parser.add_argument("--port", type=int, default=54321)
+    parser.add_argument("--groups", type=int, default=20)
+    parser.add_argument("--items", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0, help="每个请求的延迟（毫秒）")
+    args = parser.parse_args()
+
+    stub = PostgRESTStub(latency=args.latency / 1000, port=args.port)
+    stub.database.seed(groups=args.groups, items=args.items)
+    stub.start()
+    print(f"🧪 PostgREST 桩服务: {stub.url}（SUPABASE_URL={stub.url}）")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        stub.stop()
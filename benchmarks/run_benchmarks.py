@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+端到端基准
+在本进程内启动 PostgREST 桩服务（benchmarks/postgrest_stub.py，可注入延迟），生成 N 个配置组 × M 个配置项
+的合成数据，统计各入口的请求次数、耗时（平均 / p50 / p99）和峰值内存（tracemalloc），
+并可与保存的基准结果对比。全程离线运行。
+
+    python benchmarks/run_benchmarks.py                        # 与 benchmarks/baseline.json 对比
+    python benchmarks/run_benchmarks.py --save-baseline        # 重新生成基准结果
+"""
+
+import io
+import sys
+import json
+import math
+import time
+import argparse
+import platform
+import tempfile
+import tracemalloc
+from pathlib import Path
+from contextlib import redirect_stdout
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+sys.path.insert(0, str(BENCH_DIR))
+
+from postgrest_stub import PostgRESTStub
+from cloud_config_reader import CloudConfigReader, export_all_to_json
+from project_config import ProjectConfigManager
+
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+
+
+def _save_project(context, run):
+    context["manager"].save_project_info({
+        "project_name": "bench", "project_path": "/work/bench", "project_type": "python",
+        "git_repo": "https://example.com/bench.git", "description": f"run {run}"
+    })
+
+
+# 场景名称 -> 函数(context, 第几次运行)
+SCENARIOS = {
+    "get_all_configs": lambda context, run: context["reader"].get_all_configs(),
+    "get_all_configs(env)": lambda context, run: context["reader"].get_all_configs("env1"),
+    "get_all_configs(per-group)": lambda context, run: context["reader"].get_all_configs(bulk=False, max_workers=8),
+    "get_config_group": lambda context, run: context["reader"].get_config_group("group00007"),
+    "export_all_to_json": lambda context, run: export_all_to_json(
+        str(context["tmp"] / "config.json"), context["reader"]),
+    "export_all_to_json(stream)": lambda context, run: export_all_to_json(
+        str(context["tmp"] / "config.jsonl"), context["reader"], output_format="jsonl", stream=True),
+    "save_project_info": _save_project,
+    "list_projects": lambda context, run: context["manager"].list_projects(),
+}
+
+
+def percentile(values: list, fraction: float) -> float:
+    """最近秩百分位数"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def run_scenario(stub: PostgRESTStub, func, context: dict, runs: int) -> dict:
+    """预热 1 次后计时运行 runs 次，再在 tracemalloc 下运行 1 次统计峰值内存"""
+    with redirect_stdout(io.StringIO()):
+        func(context, -1)
+
+        stub.database.reset_counters()
+        timings = []
+        for run in range(runs):
+            start = time.perf_counter()
+            func(context, run)
+            timings.append((time.perf_counter() - start) * 1000)
+        round_trips = stub.database.requests / runs
+        response_bytes = stub.database.bytes_sent / runs
+
+        # tracemalloc 会明显拖慢执行，峰值内存单独测量；桩服务的响应在预热时已缓存，基本不计入峰值
+        tracemalloc.start()
+        func(context, runs)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "round_trips": round(round_trips, 2),
+        "response_kb": round(response_bytes / 1024, 1),
+        "mean_ms": round(sum(timings) / len(timings), 2),
+        "p50_ms": round(percentile(timings, 0.50), 2),
+        "p99_ms": round(percentile(timings, 0.99), 2),
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> int:
+    """打印与基准的对比，返回回退项数量（请求次数增加，或 p50 / 峰值内存超出容差）"""
+    if baseline.get("params") != results["params"]:
+        print(f"⚠️ 基准参数不同，对比仅供参考: {baseline.get('params')}", file=sys.stderr)
+
+    regressions = 0
+    print(f"\n📊 与基准对比（容差 {tolerance:.0%}）")
+    print(f"{'场景':<30}{'请求':>12}{'p50':>20}{'峰值内存':>22}")
+    for name, current in results["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            print(f"{name:<30}{'（基准中没有）':>12}")
+            continue
+        marks = []
+        trips = f"{previous['round_trips']:g}→{current['round_trips']:g}"
+        if current["round_trips"] > previous["round_trips"]:
+            marks.append("请求")
+        cells = []
+        for field in ("p50_ms", "peak_kb"):
+            change = (current[field] - previous[field]) / previous[field] if previous[field] else 0.0
+            cells.append(f"{current[field]:g} ({change:+.0%})")
+            if change > tolerance:
+                marks.append(field)
+        flag = f"  ❌ {', '.join(marks)}" if marks else ""
+        regressions += bool(marks)
+        print(f"{name:<30}{trips:>12}{cells[0]:>20}{cells[1]:>22}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="基于本地 PostgREST 桩服务的端到端基准")
+    parser.add_argument("--groups", type=int, default=200, help="配置组数量（默认：200）")
+    parser.add_argument("--items", type=int, default=20, help="每组配置项数量（默认：20）")
+    parser.add_argument("--value-size", type=int, default=4096,
+                        help="每组额外一个大 JSON 值的字节数，0 表示不生成（默认：4096）")
+    parser.add_argument("--projects", type=int, default=1000, help="project_info 行数（默认：1000）")
+    parser.add_argument("--latency", type=float, default=2.0, help="每个请求注入的延迟，毫秒（默认：2）")
+    parser.add_argument("--runs", "-n", type=int, default=20, help="每个场景的计时次数（默认：20）")
+    parser.add_argument("--only", help="只运行指定场景（逗号分隔）")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="基准结果文件")
+    parser.add_argument("--save-baseline", action="store_true", help="把本次结果保存为基准")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="p50 / 峰值内存的容差（默认：0.25）")
+    parser.add_argument("--output", "-o", help="另外把本次结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    names = args.only.split(",") if args.only else list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"未知场景: {', '.join(unknown)}（可选: {', '.join(SCENARIOS)}）")
+
+    params = {"groups": args.groups, "items": args.items, "value_size": args.value_size,
+              "projects": args.projects, "latency_ms": args.latency, "runs": args.runs}
+    results = {"python": platform.python_version(), "params": params, "results": {}}
+
+    with PostgRESTStub(latency=args.latency / 1000) as stub, tempfile.TemporaryDirectory() as tmp:
+        stub.database.seed(groups=args.groups, items=args.items, value_size=args.value_size,
+                           projects=args.projects, environments=2)
+        reader = CloudConfigReader(stub.url, "bench-key", use_daemon=False)
+        manager = ProjectConfigManager(stub.url, "bench-key")
+        # 固定使用 REST API，结果不受是否安装 supabase 影响
+        reader.backend.use_rest_api = True
+        manager.backend.use_rest_api = True
+        context = {"reader": reader, "manager": manager, "tmp": Path(tmp)}
+
+        print(f"🐍 {platform.python_version()}，{args.groups} 组 × {args.items} 项，"
+              f"延迟 {args.latency:g}ms，每项 {args.runs} 次")
+        print(f"{'场景':<30}{'请求':>6}{'响应KB':>10}{'平均':>10}{'p50':>10}{'p99':>10}{'峰值内存KB':>12}")
+        for name in names:
+            row = run_scenario(stub, SCENARIOS[name], context, args.runs)
+            results["results"][name] = row
+            print(f"{name:<30}{row['round_trips']:>6g}{row['response_kb']:>10g}{row['mean_ms']:>8.1f}ms"
+                  f"{row['p50_ms']:>8.1f}ms{row['p99_ms']:>8.1f}ms{row['peak_kb']:>12g}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.write_text(json.dumps(results, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"\n✅ 基准已保存到: {baseline_path}")
+        return
+    if not baseline_path.exists():
+        print(f"\nℹ️ 没有基准结果（{baseline_path}），使用 --save-baseline 生成")
+        return
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n❌ {regressions} 个场景相对基准回退")
+        sys.exit(1)
+    print("\n✅ 没有超出容差的回退")
+
+
+if __name__ == "__main__":
+    main()
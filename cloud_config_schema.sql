@@ -20,7 +20,7 @@ CREATE TABLE IF NOT EXISTS config_items (
     group_id UUID REFERENCES config_groups(id) ON DELETE CASCADE,
     key TEXT NOT NULL, -- 配置键（如：'SUPABASE_URL', 'GEMINI_API_KEY_1'）
     value TEXT NOT NULL, -- 配置值（敏感信息应加密存储）
-    value_type TEXT DEFAULT 'string', -- 值类型：string, number, boolean, json, array
+    value_type TEXT DEFAULT 'string', -- 值类型：string, number, boolean, json, array, duration, bytes, url
     description TEXT, -- 配置项描述
     is_encrypted BOOLEAN DEFAULT false, -- 是否为加密值
     is_secret BOOLEAN DEFAULT false, -- 是否为敏感信息（用于显示时隐藏）
@@ -46,12 +46,18 @@ CREATE TABLE IF NOT EXISTS environment_configs (
     group_id UUID REFERENCES config_groups(id) ON DELETE CASCADE,
     is_active BOOLEAN DEFAULT true,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     UNIQUE(environment_id, group_id)
 );
 
+-- 旧版本创建的表没有 updated_at 列（按环境缓存的快照需要用它判断关联是否变化）
+ALTER TABLE environment_configs ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW();
+
 -- 创建索引以提高查询性能
 CREATE INDEX IF NOT EXISTS idx_config_items_group_id ON config_items(group_id);
 CREATE INDEX IF NOT EXISTS idx_config_items_key ON config_items(key);
+-- 按前缀读取配置项（key=like.GEMINI_API_KEY_*）：数据库排序规则不是 C 时，LIKE 前缀匹配只能使用 text_pattern_ops 索引
+CREATE INDEX IF NOT EXISTS idx_config_items_key_pattern ON config_items(key text_pattern_ops);
 CREATE INDEX IF NOT EXISTS idx_config_groups_category ON config_groups(category);
 CREATE INDEX IF NOT EXISTS idx_config_groups_is_active ON config_groups(is_active);
 CREATE INDEX IF NOT EXISTS idx_environment_configs_env_id ON environment_configs(environment_id);
@@ -79,6 +85,85 @@ CREATE TRIGGER update_config_items_updated_at
     FOR EACH ROW
     EXECUTE FUNCTION update_updated_at_column();
 
+DROP TRIGGER IF EXISTS update_environment_configs_updated_at ON environment_configs;
+CREATE TRIGGER update_environment_configs_updated_at
+    BEFORE UPDATE ON environment_configs
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- ========================================
+-- 删除记录（墓碑）：增量同步用来发现被删除的配置
+-- ON DELETE CASCADE 删除后不会留下任何行，由触发器在此记录被删除行的 id
+-- 可定期清理较早的记录：DELETE FROM config_tombstones WHERE deleted_at < NOW() - INTERVAL '30 days';
+-- ========================================
+CREATE TABLE IF NOT EXISTS config_tombstones (
+    id BIGSERIAL PRIMARY KEY,
+    table_name TEXT NOT NULL, -- 'config_groups' 或 'config_items'
+    row_id UUID NOT NULL, -- 被删除行的 id
+    group_id UUID, -- 被删除配置项所属的配置组
+    key TEXT, -- 被删除配置项的键
+    deleted_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_config_tombstones_deleted_at ON config_tombstones(deleted_at);
+
+CREATE OR REPLACE FUNCTION record_config_tombstone()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'config_items' THEN
+        INSERT INTO config_tombstones (table_name, row_id, group_id, key)
+        VALUES (TG_TABLE_NAME, OLD.id, OLD.group_id, OLD.key);
+    ELSE
+        INSERT INTO config_tombstones (table_name, row_id)
+        VALUES (TG_TABLE_NAME, OLD.id);
+    END IF;
+    RETURN OLD;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS record_config_groups_tombstone ON config_groups;
+CREATE TRIGGER record_config_groups_tombstone
+    AFTER DELETE ON config_groups
+    FOR EACH ROW
+    EXECUTE FUNCTION record_config_tombstone();
+
+DROP TRIGGER IF EXISTS record_config_items_tombstone ON config_items;
+CREATE TRIGGER record_config_items_tombstone
+    AFTER DELETE ON config_items
+    FOR EACH ROW
+    EXECUTE FUNCTION record_config_tombstone();
+
+-- ========================================
+-- 项目信息表：project-config 保存的项目信息
+-- project_path 唯一，保存时通过 on_conflict=project_path 一次请求完成插入或更新
+-- ========================================
+CREATE TABLE IF NOT EXISTS project_info (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    project_name TEXT NOT NULL, -- 项目名称（默认为目录名）
+    project_path TEXT NOT NULL, -- 项目绝对路径
+    project_type TEXT, -- 主要项目类型（如：'python', 'nodejs'）
+    project_types TEXT[], -- 检测到的所有项目类型（按置信度排序）
+    git_repo TEXT, -- Git 远程仓库 URL
+    description TEXT,
+    tags TEXT[],
+    last_opened TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- 旧版本创建的表没有 project_types 列
+ALTER TABLE project_info ADD COLUMN IF NOT EXISTS project_types TEXT[];
+
+-- 唯一索引同时适用于旧版本手动创建的表（如已有重复的 project_path，需先删除重复行）
+CREATE UNIQUE INDEX IF NOT EXISTS idx_project_info_project_path ON project_info(project_path);
+CREATE INDEX IF NOT EXISTS idx_project_info_last_opened ON project_info(last_opened DESC, id);
+
+DROP TRIGGER IF EXISTS update_project_info_updated_at ON project_info;
+CREATE TRIGGER update_project_info_updated_at
+    BEFORE UPDATE ON project_info
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
 -- ========================================
 -- 初始化默认环境
 -- ========================================